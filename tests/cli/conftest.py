@@ -0,0 +1,9 @@
+# tests/cli/conftest.py
+import pytest
+from click.testing import CliRunner
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Provide a CliRunner shared by all CLI tests."""
+    return CliRunner()
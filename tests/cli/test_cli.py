@@ -2,22 +2,19 @@
 
 from unittest.mock import Mock, patch
 
-from click.testing import CliRunner
 from mobility_datasets.cli.main import cli
 
 
-def test_cli_help():
+def test_cli_help(runner):
     """Test that CLI help works."""
-    runner = CliRunner()
     result = runner.invoke(cli, ["--help"])
 
     assert result.exit_code == 0
     assert "Mobility Datasets CLI" in result.output
 
 
-def test_dataset_download_help():
+def test_dataset_download_help(runner):
     """Test dataset download help."""
-    runner = CliRunner()
     result = runner.invoke(cli, ["dataset", "download", "--help"])
 
     assert result.exit_code == 0
@@ -25,13 +22,12 @@ def test_dataset_download_help():
 
 
 @patch("mobility_datasets.kitti.loader.KITTIDownloader")
-def test_download_with_components(mock_downloader_class):
+def test_download_with_components(mock_downloader_class, runner):
     """Test downloading specific components."""
     # Mock the downloader
     mock_downloader = Mock()
     mock_downloader_class.return_value = mock_downloader
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["dataset", "download", "kitti", "--components", "oxts,calib"])
 
     assert result.exit_code == 0
@@ -41,12 +37,11 @@ def test_download_with_components(mock_downloader_class):
 
 
 @patch("mobility_datasets.kitti.loader.KITTIDownloader")
-def test_download_all(mock_downloader_class):
+def test_download_all(mock_downloader_class, runner):
     """Test downloading all components."""
     mock_downloader = Mock()
     mock_downloader_class.return_value = mock_downloader
 
-    runner = CliRunner()
     result = runner.invoke(cli, ["dataset", "download", "kitti", "--all"])
 
     assert result.exit_code == 0
@@ -54,12 +49,11 @@ def test_download_all(mock_downloader_class):
 
 
 @patch("mobility_datasets.kitti.loader.KITTIDownloader")
-def test_download_with_custom_dir(mock_downloader_class):
+def test_download_with_custom_dir(mock_downloader_class, runner):
     """Test downloading to custom directory."""
     mock_downloader = Mock()
     mock_downloader_class.return_value = mock_downloader
 
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["dataset", "download", "kitti", "--components", "oxts", "--data-dir", "/custom/path"]
     )
@@ -69,12 +63,11 @@ def test_download_with_custom_dir(mock_downloader_class):
 
 
 @patch("mobility_datasets.kitti.loader.KITTIDownloader")
-def test_download_keep_zip(mock_downloader_class):
+def test_download_keep_zip(mock_downloader_class, runner):
     """Test keeping zip files."""
     mock_downloader = Mock()
     mock_downloader_class.return_value = mock_downloader
 
-    runner = CliRunner()
     result = runner.invoke(
         cli, ["dataset", "download", "kitti", "--components", "oxts", "--keep-zip"]
     )
@@ -83,9 +76,8 @@ def test_download_keep_zip(mock_downloader_class):
     mock_downloader.download.assert_called_once_with(["oxts"], keep_zip=True)
 
 
-def test_download_without_components_or_all():
+def test_download_without_components_or_all(runner):
     """Test that error is raised when neither components nor all is specified."""
-    runner = CliRunner()
     result = runner.invoke(cli, ["dataset", "download", "kitti"])
 
     assert result.exit_code != 0
@@ -1,8 +1,53 @@
 # tests/kitti/test_downloader.py
-from unittest.mock import Mock, patch
+import errno
+import http.server
+import io
+import json
+import threading
+import time
+import zipfile
+from unittest.mock import patch
 
+import pytest
+import requests
 from mobility_datasets.kitti.loader import KITTIDownloader
 
+# End-of-central-directory record of a ZIP archive without members
+EMPTY_ZIP = b"PK\x05\x06" + b"\x00" * 18
+
+
+def make_zip(members):
+    """Build an in-memory ZIP archive from a {name: content} mapping."""
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as zip_ref:
+        for name, content in members.items():
+            zip_ref.writestr(name, content)
+    return buffer.getvalue()
+
+
+CALIB_ZIP = make_zip({"training/calib/0000.txt": "P0: 1 0 0"})
+
+
+class FakeResponse:
+    """Minimal stand-in for a streamed requests.Response."""
+
+    def __init__(self, content=b"", status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = {"content-length": str(len(content)), **(headers or {})}
+        self.closed = False
+        self._content = content
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+    def iter_content(self, chunk_size=None):
+        if self._content:
+            yield self._content
+
+    def close(self):
+        self.closed = True
+
 
 def test_download_creates_directory(tmp_path):
     """Test that data directory is created."""
@@ -12,73 +57,486 @@ def test_download_creates_directory(tmp_path):
     assert data_dir.exists()
 
 
-@patch("mobility_datasets.kitti.loader.requests.get")
-@patch("mobility_datasets.kitti.loader.zipfile.ZipFile")
-def test_download_component(mock_zipfile, mock_requests, tmp_path):
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_download_component(mock_session, tmp_path):
     """Test downloading a single component."""
-    # Mock HTTP response
-    mock_response = Mock()
-    mock_response.headers = {"content-length": "1024"}
-    mock_response.iter_content = Mock(return_value=[b"data" * 256])
-    mock_requests.return_value = mock_response
-
-    # Mock zipfile
-    mock_zip = Mock()
-    mock_zipfile.return_value.__enter__ = Mock(return_value=mock_zip)
-    mock_zipfile.return_value.__exit__ = Mock(return_value=None)
+    mock_get = mock_session.return_value.get
+    mock_get.return_value = FakeResponse(CALIB_ZIP)
 
     # Test
     downloader = KITTIDownloader(data_dir=str(tmp_path))
     downloader.download(["calib"])
 
     # Verify requests was called
-    mock_requests.assert_called_once()
-    assert "data_tracking_calib.zip" in mock_requests.call_args[0][0]
+    mock_get.assert_called_once()
+    assert "data_tracking_calib.zip" in mock_get.call_args[0][0]
 
+    # Verify archive was extracted and removed
+    assert (tmp_path / "training/calib/0000.txt").read_text() == "P0: 1 0 0"
+    assert not (tmp_path / "data_tracking_calib.zip").exists()
 
-@patch("mobility_datasets.kitti.loader.requests.get")
-@patch("mobility_datasets.kitti.loader.zipfile.ZipFile")
-def test_download_all(mock_zipfile, mock_requests, tmp_path):
-    """Test downloading all components."""
-    # Mock HTTP response
-    mock_response = Mock()
-    mock_response.headers = {"content-length": "1024"}
-    mock_response.iter_content = Mock(return_value=[b"data" * 256])
-    mock_requests.return_value = mock_response
 
-    # Mock zipfile
-    mock_zip = Mock()
-    mock_zipfile.return_value.__enter__ = Mock(return_value=mock_zip)
-    mock_zipfile.return_value.__exit__ = Mock(return_value=None)
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_download_all(mock_session, tmp_path):
+    """Test downloading all components."""
+    mock_get = mock_session.return_value.get
+    mock_get.side_effect = lambda *args, **kwargs: FakeResponse(CALIB_ZIP)
 
     # Test
     downloader = KITTIDownloader(data_dir=str(tmp_path))
     downloader.download_all()
 
     # Verify all 6 components were downloaded
-    assert mock_requests.call_count == 6
+    assert mock_get.call_count == 6
+
+
+def test_download_all_forwards_workers(tmp_path):
+    """Test that download_all() passes max_workers on to download()."""
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+
+    with patch.object(downloader, "download") as mock_download:
+        downloader.download_all(max_workers=2)
+
+    components = list(KITTIDownloader.AVAILABLE_FILES)
+    mock_download.assert_called_once_with(components, False, 2)
 
 
-@patch("mobility_datasets.kitti.loader.requests.get")
-@patch("mobility_datasets.kitti.loader.zipfile.ZipFile")
-def test_skip_existing_file(mock_zipfile, mock_requests, tmp_path, capsys):
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_skip_existing_file(mock_session, tmp_path, capsys):
     """Test that existing files are skipped."""
-    # Create existing zip file
+    mock_get = mock_session.return_value.get
+
+    # Create existing (empty) zip file
     zip_path = tmp_path / "data_tracking_calib.zip"
-    zip_path.touch()
+    zip_path.write_bytes(EMPTY_ZIP)
 
     # Test
     downloader = KITTIDownloader(data_dir=str(tmp_path))
     downloader.download(["calib"])
 
     # Verify no download was attempted
-    mock_requests.assert_not_called()
+    mock_get.assert_not_called()
 
     # Verify message was printed
     captured = capsys.readouterr()
     assert "already exists" in captured.out
 
 
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_redownload_truncated_file(mock_session, tmp_path):
+    """Test that a truncated archive is downloaded again."""
+    mock_get = mock_session.return_value.get
+
+    # Create truncated zip file
+    zip_path = tmp_path / "data_tracking_calib.zip"
+    zip_path.write_bytes(b"PK\x03\x04")
+
+    # HTTP response with a complete archive
+    mock_get.return_value = FakeResponse(EMPTY_ZIP)
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify the archive was replaced
+    mock_get.assert_called_once()
+    assert zip_path.read_bytes() == EMPTY_ZIP
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_resume_partial_download(mock_session, tmp_path):
+    """Test that a partial download is resumed with a Range request."""
+    mock_get = mock_session.return_value.get
+
+    # Create partial download
+    part_path = tmp_path / "data_tracking_calib.zip.part"
+    part_path.write_bytes(b"head")
+
+    # HTTP 206 response with the remaining bytes
+    mock_get.return_value = FakeResponse(b"tail", status_code=206)
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify only the missing bytes were requested
+    assert mock_get.call_args[1]["headers"] == {"Range": "bytes=4-"}
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == b"headtail"
+    assert not part_path.exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_resume_sends_if_range(mock_session, tmp_path):
+    """Test that a resumed download is bound to the ETag of the partial file."""
+    mock_get = mock_session.return_value.get
+    mock_get.return_value = FakeResponse(b"tail", status_code=206)
+
+    # Create partial download with the ETag of its first response
+    (tmp_path / "data_tracking_calib.zip.part").write_bytes(b"head")
+    (tmp_path / "data_tracking_calib.zip.part.etag").write_text('"v1"')
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify the ETag was sent and the sidecar removed
+    assert mock_get.call_args[1]["headers"] == {"Range": "bytes=4-", "If-Range": '"v1"'}
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == b"headtail"
+    assert not (tmp_path / "data_tracking_calib.zip.part.etag").exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_resume_changed_file(mock_session, tmp_path):
+    """Test that a partial download of an outdated file is replaced."""
+    mock_get = mock_session.return_value.get
+
+    # Create partial download of the previous version
+    (tmp_path / "data_tracking_calib.zip.part").write_bytes(b"old version")
+    (tmp_path / "data_tracking_calib.zip.part.etag").write_text('"v1"')
+
+    # Server answers If-Range with the full new version
+    mock_get.return_value = FakeResponse(EMPTY_ZIP, headers={"etag": '"v2"'})
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify the old partial data was discarded
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == EMPTY_ZIP
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_resume_complete_partial_download(mock_session, tmp_path):
+    """Test that a complete partial download is finalized without data transfer."""
+    mock_get = mock_session.return_value.get
+
+    # Create partial download holding all bytes
+    part_path = tmp_path / "data_tracking_calib.zip.part"
+    part_path.write_bytes(EMPTY_ZIP)
+
+    # HTTP 416 response (range not satisfiable), raise_for_status() would fail
+    mock_get.return_value = FakeResponse(status_code=416)
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify the partial file was promoted
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == EMPTY_ZIP
+    assert not part_path.exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_resume_invalid_partial_download(mock_session, tmp_path):
+    """Test that a stale partial download is discarded on HTTP 416."""
+    mock_get = mock_session.return_value.get
+
+    # Create partial download that is not a valid archive
+    part_path = tmp_path / "data_tracking_calib.zip.part"
+    part_path.write_bytes(b"stale partial download")
+
+    # HTTP 416 response, then the full archive
+    mock_get.side_effect = [FakeResponse(status_code=416), FakeResponse(EMPTY_ZIP)]
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify the download restarted without a Range header
+    assert mock_get.call_count == 2
+    assert mock_get.call_args[1]["headers"] == {}
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == EMPTY_ZIP
+    assert not part_path.exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_download_parallel_ranges(mock_session, tmp_path):
+    """Test that large files are downloaded over parallel byte ranges."""
+    mock_get = mock_session.return_value.get
+
+    # Initial HTTP response advertising range support, then the second range
+    initial_response = FakeResponse(b"abcdefgh", headers={"accept-ranges": "bytes"})
+    range_response = FakeResponse(b"efgh", status_code=206)
+    mock_get.side_effect = [initial_response, range_response]
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader.RANGE_CONNECTIONS = 2
+    downloader.RANGE_THRESHOLD = 0
+    downloader._download_file("calib")
+
+    # Verify the second half was requested separately
+    assert mock_get.call_args[1]["headers"] == {"Range": "bytes=4-7"}
+    assert initial_response.closed and range_response.closed
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == b"abcdefgh"
+    assert not (tmp_path / "data_tracking_calib.zip.part.ranges").exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_failed_range_keeps_progress(mock_session, tmp_path):
+    """Test that a failed range keeps the partial file and its progress."""
+    mock_get = mock_session.return_value.get
+
+    # Second range is cut off after two of its four bytes
+    initial_response = FakeResponse(b"abcdefgh", headers={"accept-ranges": "bytes", "etag": '"v1"'})
+    range_response = FakeResponse(b"ef", status_code=206)
+    mock_get.side_effect = [initial_response, range_response]
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader.RANGE_CONNECTIONS = 2
+    downloader.RANGE_THRESHOLD = 0
+    downloader.RANGE_CHECKPOINT = 1
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        downloader._download_file("calib")
+
+    # Verify the partial file is kept with the progress of each range
+    assert (tmp_path / "data_tracking_calib.zip.part").exists()
+    sidecar = json.loads((tmp_path / "data_tracking_calib.zip.part.ranges").read_text())
+    assert sidecar["ranges"] == [[0, 3, 4], [4, 7, 6]]
+    assert (tmp_path / "data_tracking_calib.zip.part.etag").read_text() == '"v1"'
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_failed_range_stops_other_ranges(mock_session, tmp_path):
+    """Test that a failed range stops the other ranges instead of waiting for them."""
+    mock_get = mock_session.return_value.get
+
+    # First range streams slowly, the second range fails right away
+    class SlowResponse(FakeResponse):
+        def iter_content(self, chunk_size=None):
+            for byte in self._content:
+                time.sleep(0.02)
+                yield bytes([byte])
+
+    initial_response = SlowResponse(b"x" * 200, headers={"accept-ranges": "bytes"})
+    mock_get.side_effect = [initial_response, FakeResponse(status_code=500)]
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader.RANGE_CONNECTIONS = 2
+    downloader.RANGE_THRESHOLD = 0
+    start = time.monotonic()
+    with pytest.raises(requests.exceptions.HTTPError):
+        downloader._download_file("calib")
+
+    # Verify the first range stopped early and kept its progress
+    assert time.monotonic() - start < 1
+    sidecar = json.loads((tmp_path / "data_tracking_calib.zip.part.ranges").read_text())
+    assert sidecar["ranges"][0][2] < 100
+
+
+@patch("mobility_datasets.kitti.loader.os.posix_fallocate", create=True)
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_range_allocation_error(mock_session, mock_fallocate, tmp_path):
+    """Test that a full disk aborts the download instead of writing a sparse file."""
+    mock_session.return_value.get.return_value = FakeResponse(
+        b"abcdefgh", headers={"accept-ranges": "bytes"}
+    )
+    mock_fallocate.side_effect = OSError(errno.ENOSPC, "No space left on device")
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader.RANGE_CONNECTIONS = 2
+    downloader.RANGE_THRESHOLD = 0
+    with pytest.raises(OSError) as excinfo:
+        downloader._download_file("calib")
+
+    # Verify the error was not swallowed
+    assert excinfo.value.errno == errno.ENOSPC
+    assert not (tmp_path / "data_tracking_calib.zip").exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_resume_parallel_ranges(mock_session, tmp_path):
+    """Test that an interrupted ranged download resumes only unfinished ranges."""
+    mock_get = mock_session.return_value.get
+    mock_get.return_value = FakeResponse(b"gh", status_code=206)
+
+    # Previous run finished the first range and half of the second one
+    (tmp_path / "data_tracking_calib.zip.part").write_bytes(b"abcdef\x00\x00")
+    (tmp_path / "data_tracking_calib.zip.part.ranges").write_text(
+        json.dumps({"ranges": [[0, 3, 4], [4, 7, 6]]})
+    )
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify only the missing bytes of the second range were requested
+    mock_get.assert_called_once()
+    assert mock_get.call_args[1]["headers"] == {"Range": "bytes=6-7"}
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == b"abcdefgh"
+    assert not (tmp_path / "data_tracking_calib.zip.part.ranges").exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_resume_parallel_ranges_changed_file(mock_session, tmp_path):
+    """Test that an interrupted ranged download restarts if the file changed."""
+    mock_get = mock_session.return_value.get
+
+    # Previous run of the old version finished the first range only
+    (tmp_path / "data_tracking_calib.zip.part").write_bytes(b"abcd\x00\x00\x00\x00")
+    (tmp_path / "data_tracking_calib.zip.part.ranges").write_text(
+        json.dumps({"ranges": [[0, 3, 4], [4, 7, 4]]})
+    )
+    (tmp_path / "data_tracking_calib.zip.part.etag").write_text('"v1"')
+
+    # If-Range does not match: full new version, then the restarted download
+    mock_get.side_effect = [FakeResponse(b"ABCDEFGH"), FakeResponse(CALIB_ZIP)]
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify the range was bound to the ETag and the download restarted
+    first_headers = mock_get.call_args_list[0][1]["headers"]
+    assert first_headers == {"Range": "bytes=4-7", "If-Range": '"v1"'}
+    assert mock_get.call_args[1]["headers"] == {}
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == CALIB_ZIP
+    assert not (tmp_path / "data_tracking_calib.zip.part.ranges").exists()
+
+
+@pytest.mark.parametrize("sidecar", ['{"ranges": [[0', '{"ranges": [[0, 7]]}'])
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_corrupt_ranges_restarts_download(mock_session, tmp_path, sidecar):
+    """Test that a ranged partial file with an unreadable sidecar is discarded."""
+    mock_get = mock_session.return_value.get
+    mock_get.return_value = FakeResponse(CALIB_ZIP)
+
+    # Full-size partial file with gaps and a truncated or malformed sidecar
+    (tmp_path / "data_tracking_calib.zip.part").write_bytes(b"\x00" * len(CALIB_ZIP))
+    (tmp_path / "data_tracking_calib.zip.part.ranges").write_text(sidecar)
+
+    # Test
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader._download_file("calib")
+
+    # Verify the download restarted from the beginning
+    assert mock_get.call_args[1]["headers"] == {}
+    assert (tmp_path / "data_tracking_calib.zip").read_bytes() == CALIB_ZIP
+    assert not (tmp_path / "data_tracking_calib.zip.part.ranges").exists()
+
+
+@patch("mobility_datasets.kitti.loader.requests.Session")
+def test_interrupt_stops_running_downloads(mock_session, tmp_path):
+    """Test that an interrupt aborts in-flight downloads at the next chunk."""
+    mock_get = mock_session.return_value.get
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+
+    # Slow download that keeps streaming until it is cancelled
+    class SlowResponse(FakeResponse):
+        def iter_content(self, chunk_size=None):
+            for _ in range(50):
+                yield b"data"
+                downloader._cancel.wait(0.1)
+
+    started = threading.Event()
+
+    def get(url, **kwargs):
+        if "oxts" in url:
+            started.set()
+            return SlowResponse(b"data" * 50)
+        started.wait(1)
+        raise KeyboardInterrupt
+
+    mock_get.side_effect = get
+
+    # Test
+    start = time.monotonic()
+    with pytest.raises(KeyboardInterrupt):
+        downloader.download(["oxts", "calib"], max_workers=2)
+
+    # Verify the slow download stopped early and kept its partial file
+    assert time.monotonic() - start < 2
+    assert (tmp_path / "data_tracking_oxts.zip.part").exists()
+    assert not (tmp_path / "data_tracking_oxts.zip").exists()
+
+
+def test_interrupt_with_stalled_connection(tmp_path):
+    """Test that an interrupt returns while a worker is blocked on a stalled socket."""
+    stalled, release = threading.Event(), threading.Event()
+
+    # HTTP server that sends the headers and a few bytes, then stops sending
+    class StalledHandler(http.server.BaseHTTPRequestHandler):
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "1024")
+            self.end_headers()
+            self.wfile.write(b"data")
+            self.wfile.flush()
+            stalled.set()
+            release.wait(10)
+
+        def log_message(self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), StalledHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader.BASE_URL = f"http://127.0.0.1:{server.server_port}/"
+    downloader.TIMEOUT = (1, 0.5)
+    session_get = downloader._session.get
+
+    def get(url, **kwargs):
+        if "oxts" in url:
+            return session_get(url, **kwargs)
+        stalled.wait(1)
+        raise KeyboardInterrupt
+
+    # Test
+    try:
+        with patch.object(downloader._session, "get", side_effect=get):
+            start = time.monotonic()
+            with pytest.raises(KeyboardInterrupt):
+                downloader.download(["oxts", "calib"], max_workers=2)
+    finally:
+        release.set()
+        server.shutdown()
+        server.server_close()
+
+    # Verify the blocked worker gave up after the read timeout
+    assert time.monotonic() - start < 3
+
+
+def test_extract_archive(tmp_path):
+    """Test that archive members are extracted below the data directory."""
+    # Create archive with a nested file and an unsafe member name
+    downloader = KITTIDownloader(data_dir=str(tmp_path / "kitti"))
+    zip_path = downloader.data_dir / "data_tracking_calib.zip"
+    zip_path.write_bytes(
+        make_zip({"training/calib/0000.txt": "P0: 1 0 0", "../outside.txt": "escaped"})
+    )
+
+    # Test
+    downloader._unzip_file("calib", keep_zip=False)
+
+    # Verify extracted files and removed archive
+    assert (tmp_path / "kitti/training/calib/0000.txt").read_text() == "P0: 1 0 0"
+    assert (tmp_path / "kitti/outside.txt").exists()
+    assert not (tmp_path / "outside.txt").exists()
+    assert not (tmp_path / "kitti/data_tracking_calib.zip").exists()
+
+
+def test_connection_pool_matches_workers(tmp_path):
+    """Test that the connection pool grows with the number of workers."""
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+    downloader.download([], max_workers=8)
+
+    adapter = downloader._session.get_adapter(KITTIDownloader.BASE_URL)
+    pool_kw = adapter.poolmanager.connection_pool_kw
+    assert pool_kw["maxsize"] == 8 * KITTIDownloader.RANGE_CONNECTIONS
+
+
+def test_invalid_max_workers(tmp_path):
+    """Test that a non-positive number of workers is rejected."""
+    downloader = KITTIDownloader(data_dir=str(tmp_path))
+
+    with pytest.raises(ValueError, match="max_workers"):
+        downloader.download(["calib"], max_workers=0)
+
+
 def test_unknown_component(tmp_path, capsys):
     """Test handling of unknown component."""
     downloader = KITTIDownloader(data_dir=str(tmp_path))